@@ -3,9 +3,10 @@
 # on an 8x8 board using the Breadth-First Search (BFS) algorithm.
 
 import pygame
+import array
 import collections
+import concurrent.futures
 import math
-import time
 import sys
 
 # --- Constants ---
@@ -14,6 +15,9 @@ SCREEN_HEIGHT = 640
 BOARD_SIZE = 8
 SQUARE_SIZE = SCREEN_WIDTH // BOARD_SIZE
 PI = math.pi
+# Half-sine lookup for the jump curve: the arc is purely aesthetic, so
+# 256 samples are plenty and save a libm sin() call every frame
+SIN_JUMP = tuple(math.sin(i * PI / 255) for i in range(256))
 FPS = 60
 BFS_DELAY_MS = 60  # Time delay between BFS steps in milliseconds
 
@@ -30,26 +34,9 @@ WHITE = (255, 255, 255)
 
 # --- Data Structures ---
 
-class Point:
-    """Represents a coordinate (column, row) on the board."""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __lt__(self, other):
-        # Used for key in sets and maps (required for consistency)
-        if self.x != other.x:
-            return self.x < other.x
-        return self.y < other.y
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return f"({self.x}, {self.y})"
+# Squares are packed into a single int: sq = y * BOARD_SIZE + x (0..63).
+# Plain ints hash to themselves, so every set/dict operation in the BFS
+# is a single C-level probe instead of attribute access + tuple hashing.
 
 class PieceType:
     KNIGHT, KING, ROOK, BISHOP, QUEEN = range(5)
@@ -62,73 +49,146 @@ KNIGHT_MOVES = [
     (1, 2), (1, -2), (-1, 2), (-1, -2)
 ]
 
-def is_on_board(p):
-    """Checks if a Point is within the 8x8 board boundaries."""
-    return 0 <= p.x < BOARD_SIZE and 0 <= p.y < BOARD_SIZE
-
-def get_knight_moves(p):
-    """Calculates all legal Knight moves from point p."""
+def get_knight_moves(sq):
+    """Calculates all legal Knight moves from square sq."""
     neighbors = []
+    x, y = sq & 7, sq >> 3
     for dx, dy in KNIGHT_MOVES:
-        n = Point(p.x + dx, p.y + dy)
-        if is_on_board(n):
-            neighbors.append(n)
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+            neighbors.append(ny * BOARD_SIZE + nx)
     return neighbors
 
-def get_king_moves(p):
-    """Calculates all legal King moves from point p (1 step in any direction)."""
+def get_king_moves(sq):
+    """Calculates all legal King moves from square sq (1 step in any direction)."""
     neighbors = []
+    x, y = sq & 7, sq >> 3
     for dx in range(-1, 2):
         for dy in range(-1, 2):
             if dx == 0 and dy == 0:
                 continue
-            n = Point(p.x + dx, p.y + dy)
-            if is_on_board(n):
-                neighbors.append(n)
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+                neighbors.append(ny * BOARD_SIZE + nx)
     return neighbors
 
-def sliding_moves(p, dirs):
-    """
-    Helper function for sliding pieces (Rook, Bishop, Queen).
-    Iterates in specified directions until hitting the board edge.
-    """
-    neighbors = []
+# Sliding pieces are built as ray-attack bitboards: one 64-bit mask per
+# square holding every reachable square, in the spirit of chess engines'
+# precomputed attack tables. The board is always empty here, so no
+# blocker handling is needed.
+
+ROOK_DIRS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+def ray_attacks(sq, dirs):
+    """Builds the bitboard of all squares a slider on sq reaches along dirs."""
+    mask = 0
+    x, y = sq & 7, sq >> 3
     for dx, dy in dirs:
-        nx, ny = p.x + dx, p.y + dy
-        while is_on_board(Point(nx, ny)):
-            neighbors.append(Point(nx, ny))
+        nx, ny = x + dx, y + dy
+        while 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+            mask |= 1 << (ny * BOARD_SIZE + nx)
             nx += dx
             ny += dy
-    return neighbors
-
-def get_rook_moves(p):
-    """Calculates all legal Rook moves (orthogonal sliding)."""
-    dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-    return sliding_moves(p, dirs)
-
-def get_bishop_moves(p):
-    """Calculates all legal Bishop moves (diagonal sliding)."""
-    dirs = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-    return sliding_moves(p, dirs)
-
-def get_queen_moves(p):
-    """Calculates all legal Queen moves (all sliding directions)."""
-    dirs = [
-        (1, 0), (-1, 0), (0, 1), (0, -1),
-        (1, 1), (1, -1), (-1, 1), (-1, -1)
-    ]
-    return sliding_moves(p, dirs)
-
-
-# Map piece type to its movement function
-MOVE_FUNCTIONS = {
-    PieceType.KNIGHT: get_knight_moves,
-    PieceType.KING: get_king_moves,
-    PieceType.ROOK: get_rook_moves,
-    PieceType.BISHOP: get_bishop_moves,
-    PieceType.QUEEN: get_queen_moves,
+    return mask
+
+def bits_to_squares(mask):
+    """Expands an attack bitboard into a tuple of square indices."""
+    squares = []
+    while mask:
+        lsb = mask & -mask
+        squares.append(lsb.bit_length() - 1)
+        mask ^= lsb
+    return tuple(squares)
+
+ROOK_ATTACKS = [ray_attacks(sq, ROOK_DIRS) for sq in range(64)]
+BISHOP_ATTACKS = [ray_attacks(sq, BISHOP_DIRS) for sq in range(64)]
+QUEEN_ATTACKS = [ROOK_ATTACKS[sq] | BISHOP_ATTACKS[sq] for sq in range(64)]
+
+
+# Precomputed neighbor tables: MOVE_TABLES[piece][sq] -> tuple of squares.
+# The board never changes, so the move functions above only run once here
+# at import time; the BFS inner loop is then a plain tuple iteration with
+# no function calls, allocations or bounds checks.
+KNIGHT_TBL = [tuple(get_knight_moves(sq)) for sq in range(64)]
+KING_TBL = [tuple(get_king_moves(sq)) for sq in range(64)]
+ROOK_TBL = [bits_to_squares(mask) for mask in ROOK_ATTACKS]
+BISHOP_TBL = [bits_to_squares(mask) for mask in BISHOP_ATTACKS]
+QUEEN_TBL = [bits_to_squares(mask) for mask in QUEEN_ATTACKS]
+
+MOVE_TABLES = {
+    PieceType.KNIGHT: KNIGHT_TBL,
+    PieceType.KING: KING_TBL,
+    PieceType.ROOK: ROOK_TBL,
+    PieceType.BISHOP: BISHOP_TBL,
+    PieceType.QUEEN: QUEEN_TBL,
 }
 
+# --- Precomputed Search Tables ---
+# The search graph depends only on the piece type (5 pieces x 64 squares),
+# so every BFS result can be computed once at startup: 5 * 64 = 320 tiny
+# BFSes. Pressing SPACE then just replays a stored visitation order; no
+# search runs while the visualization is on screen.
+#
+#   DIST[piece][start][sq]    shortest distance start -> sq (-1 unreachable)
+#   PARENT[piece][start][sq]  predecessor of sq in the BFS tree (-1 = none)
+#   VISIT_ORDER[piece][start] squares in the order BFS dequeued them
+#   EDGES[piece][start][i]    tree edges discovered while expanding the
+#                             i-th square of VISIT_ORDER
+
+DIST = [[None] * 64 for _ in range(5)]
+PARENT = [[None] * 64 for _ in range(5)]
+VISIT_ORDER = [[None] * 64 for _ in range(5)]
+EDGES = [[None] * 64 for _ in range(5)]
+
+def _bfs_from(piece, start):
+    """Runs one full BFS from start and returns (dist, parent, order, edges)."""
+    # Flat signed-byte arrays indexed by square: constant-time access with
+    # no hashing, and a 64-byte footprint instead of a dict per run
+    dist = array.array('b', [-1] * 64)
+    parent = array.array('b', [-1] * 64)
+    order = []
+    edges = []
+    dist[start] = 0
+    visited = 1 << start
+    queue = collections.deque([start])
+    moves = MOVE_TABLES[piece]  # hoisted: one dict lookup per run, not per pop
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        step_edges = []
+        for neighbor in moves[current]:
+            # test-and-set on the visited bitboard
+            bit = 1 << neighbor
+            if visited & bit:
+                continue
+            visited |= bit
+            dist[neighbor] = dist[current] + 1
+            parent[neighbor] = current
+            queue.append(neighbor)
+            step_edges.append((current, neighbor))
+        edges.append(tuple(step_edges))
+    return dist, parent, tuple(order), tuple(edges)
+
+def _bfs_task(task):
+    """Worker wrapper: unpacks a (piece, start) task for the process pool."""
+    return _bfs_from(*task)
+
+def _precompute_all():
+    """Fills DIST/PARENT/VISIT_ORDER/EDGES for every piece and start square.
+
+    The 320 BFSes are independent, so they are spread over a process pool
+    (one worker per CPU); workers only need the import-time move tables.
+    """
+    tasks = [(piece, start) for piece in range(5) for start in range(64)]
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        results = executor.map(_bfs_task, tasks, chunksize=32)
+        for (piece, start), (dist, parent, order, edges) in zip(tasks, results):
+            DIST[piece][start] = dist
+            PARENT[piece][start] = parent
+            VISIT_ORDER[piece][start] = order
+            EDGES[piece][start] = edges
+
 # --- Visualizer Class ---
 
 class BFSVisualizer:
@@ -139,6 +199,19 @@ class BFSVisualizer:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
 
+        # The checkerboard never changes: render it once into a Surface
+        # and blit it each frame instead of drawing 64 rects
+        self.board_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                color = GRAY_LIGHT if (r + c) % 2 == 0 else GRAY_DARK
+                rect = pygame.Rect(c * SQUARE_SIZE, r * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                pygame.draw.rect(self.board_surface, color, rect)
+
+        # Same idea for the piece symbols: draw each one once into a small
+        # transparent Surface, then blit instead of re-running draw primitives
+        self.piece_surfaces = {pt: self._render_piece(pt) for pt in range(5)}
+
         # State Variables
         self.start_pos = None
         self.goal_pos = None
@@ -147,20 +220,28 @@ class BFSVisualizer:
         self.path_found = False
         self.animating_path = False
         
-        # BFS Variables
-        self.queue = collections.deque()
-        self.visited = set()
-        self.parents = {}
-        self.edges_explored = []
+        # BFS Variables (replayed from the precomputed tables; visited
+        # state lives in _bfs_from, the replay only reveals its results)
+        self.parents = None  # PARENT row for the active run
+        self.visit_order = ()
+        self.step_edges = ()
+        self.replay_index = 0
+        # Render caches, built once per insertion instead of per frame
+        self.visited_rects = []  # pygame.Rect per visited square
+        self.edge_lines = []     # ((x1, y1), (x2, y2)) center points per edge
         self.current_node = None
         self.last_bfs_step_time = 0
 
         # Animation Variables
         self.shortest_path = []
+        self.path_points = []  # square centers of shortest_path, in pixels
         self.anim_index = 0
         self.anim_progress = 0.0
         self.render_pos = (-SQUARE_SIZE, -SQUARE_SIZE) # Offscreen initially
-        
+
+        # Redraw only when something changed (input, BFS step, animation)
+        self.dirty = True
+
         self.reset_state()
 
     def reset_state(self):
@@ -170,49 +251,58 @@ class BFSVisualizer:
         self.running_bfs = False
         self.path_found = False
         self.animating_path = False
-        self.queue.clear()
-        self.visited.clear()
-        self.parents.clear()
-        self.edges_explored.clear()
+        self.parents = None
+        self.visit_order = ()
+        self.step_edges = ()
+        self.replay_index = 0
+        self.visited_rects.clear()
+        self.edge_lines.clear()
         self.shortest_path.clear()
+        self.path_points.clear()
         self.anim_index = 0
         self.anim_progress = 0.0
         self.current_node = None
         self.render_pos = (-SQUARE_SIZE, -SQUARE_SIZE)
 
-    def get_square_coords(self, p):
-        """Returns the top-left pixel coordinates for a Point."""
-        return (p.x * SQUARE_SIZE, p.y * SQUARE_SIZE)
+    def get_square_coords(self, sq):
+        """Returns the top-left pixel coordinates for a packed square index."""
+        return ((sq & 7) * SQUARE_SIZE, (sq >> 3) * SQUARE_SIZE)
 
     def start_bfs(self):
         """Initializes the BFS algorithm."""
-        if not self.start_pos or not self.goal_pos or self.running_bfs:
+        # Square 0 is a valid (falsy) position, so compare against None
+        if self.start_pos is None or self.goal_pos is None or self.running_bfs:
             return
 
         # Reset search-specific variables
-        self.queue.clear()
-        self.visited.clear()
-        self.parents.clear()
-        self.edges_explored.clear()
+        self.visited_rects.clear()
+        self.edge_lines.clear()
         self.shortest_path.clear()
+        self.path_points.clear()
         self.path_found = False
         self.animating_path = False
         self.current_node = None
-        
-        # Initialize BFS
-        self.queue.append(self.start_pos)
-        self.visited.add(self.start_pos)
-        self.parents[self.start_pos] = None
+
+        # Pull the precomputed run for this piece/start; the replay just
+        # walks visit_order one square per step
+        piece, start = self.current_piece, self.start_pos
+        self.parents = PARENT[piece][start]
+        self.visit_order = VISIT_ORDER[piece][start]
+        self.step_edges = EDGES[piece][start]
+        self.replay_index = 0
         self.running_bfs = True
-        self.last_bfs_step_time = time.time()
+        self.last_bfs_step_time = pygame.time.get_ticks()
 
     def step_bfs(self):
-        """Performs one step of the BFS algorithm."""
-        if not self.queue:
+        """Replays one step of the precomputed BFS visitation order."""
+        # every branch below mutates visible state, including the final
+        # transition out of running_bfs
+        self.dirty = True
+        if self.replay_index >= len(self.visit_order):
             self.running_bfs = False
             return
 
-        current = self.queue.popleft()
+        current = self.visit_order[self.replay_index]
         self.current_node = current
 
         # Check for goal
@@ -227,33 +317,41 @@ class BFSVisualizer:
             self.render_pos = (x, y)
             return
 
-        # Expand neighbors using the appropriate move function
-        move_func = MOVE_FUNCTIONS[self.current_piece]
-        neighbors = move_func(current)
-
-        for neighbor in neighbors:
-            if neighbor not in self.visited:
-                self.visited.add(neighbor)
-                self.parents[neighbor] = current
-                self.queue.append(neighbor)
-                self.edges_explored.append((current, neighbor))
+        # Reveal the tree edges this expansion discovered, caching their
+        # render geometry so draw_scene never recomputes it
+        half = SQUARE_SIZE // 2
+        for parent_sq, child_sq in self.step_edges[self.replay_index]:
+            if child_sq != self.goal_pos:
+                x, y = self.get_square_coords(child_sq)
+                self.visited_rects.append(
+                    pygame.Rect(x + 2, y + 2, SQUARE_SIZE - 4, SQUARE_SIZE - 4))
+            px, py = self.get_square_coords(parent_sq)
+            cx, cy = self.get_square_coords(child_sq)
+            self.edge_lines.append(((px + half, py + half), (cx + half, cy + half)))
+        self.replay_index += 1
 
     def reconstruct_path(self):
         """Backtracks from goal to start using the parents map."""
         curr = self.goal_pos
         temp_path = []
-        while curr is not None:
+        while curr != -1:
             temp_path.append(curr)
             if curr == self.start_pos: break
-            curr = self.parents.get(curr)
-        
+            curr = self.parents[curr]
+
         # Reverse to get start -> goal order
         self.shortest_path = temp_path[::-1]
 
+        # Cache the pixel centers for the batched path polyline
+        half = SQUARE_SIZE // 2
+        self.path_points = [(x + half, y + half) for x, y in
+                            map(self.get_square_coords, self.shortest_path)]
+
     def update_animation(self):
         """Updates the interpolated position of the moving piece."""
         if not self.shortest_path: return
-        
+
+        self.dirty = True
         if self.anim_index >= len(self.shortest_path) - 1:
             self.animating_path = False
             # Snap to final position
@@ -276,7 +374,7 @@ class BFSVisualizer:
 
         # Jump effect (more pronounced for Knight)
         jump_height = 20 if self.current_piece == PieceType.KNIGHT else 8
-        jump_offset = math.sin(self.anim_progress * PI) * jump_height
+        jump_offset = SIN_JUMP[min(255, int(self.anim_progress * 255))] * jump_height
         
         cur_y -= jump_offset
         
@@ -291,12 +389,8 @@ class BFSVisualizer:
     # --- Drawing Methods ---
     
     def draw_board(self):
-        """Draws the checkerboard pattern."""
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                color = GRAY_LIGHT if (r + c) % 2 == 0 else GRAY_DARK
-                rect = pygame.Rect(c * SQUARE_SIZE, r * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-                pygame.draw.rect(self.screen, color, rect)
+        """Blits the pre-rendered checkerboard background."""
+        self.screen.blit(self.board_surface, (0, 0))
 
     def draw_piece_symbol(self, surface, piece_type, x, y):
         """Draws a simple symbolic representation of a chess piece."""
@@ -328,54 +422,49 @@ class BFSVisualizer:
             pygame.draw.polygon(surface, BLACK, [(cx - r, cy + r), (cx + r, cy + r), (cx + r, cy - r), (cx, cy - r * 1.5), (cx - r, cy - r)])
             pygame.draw.circle(surface, WHITE, (cx, cy - r // 2), 5)
 
+    def _render_piece(self, piece_type):
+        """Renders one piece symbol into a transparent square Surface."""
+        surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+        self.draw_piece_symbol(surface, piece_type, 0, 0)
+        return surface
+
 
     def draw_scene(self):
         """Renders all game elements."""
         self.draw_board()
 
         # 1. Draw Visited Squares (Blue)
-        for p in self.visited:
-            if p != self.start_pos and p != self.goal_pos:
-                rect = pygame.Rect(self.get_square_coords(p), (SQUARE_SIZE - 4, SQUARE_SIZE - 4))
-                rect.move_ip(2, 2)
-                pygame.draw.rect(self.screen, BLUE_VISITED, rect)
+        for rect in self.visited_rects:
+            pygame.draw.rect(self.screen, BLUE_VISITED, rect)
 
         # 2. Draw Edges (Gray lines)
-        for p1, p2 in self.edges_explored:
-            c1x, c1y = self.get_square_coords(p1)
-            c2x, c2y = self.get_square_coords(p2)
-            pygame.draw.line(self.screen, EDGE_COLOR, 
-                             (c1x + SQUARE_SIZE // 2, c1y + SQUARE_SIZE // 2),
-                             (c2x + SQUARE_SIZE // 2, c2y + SQUARE_SIZE // 2), 2)
-
-        # 3. Draw Path Overlay (Green lines/rectangles)
-        if self.path_found and not self.animating_path:
-            for p in self.shortest_path:
-                rect = pygame.Rect(self.get_square_coords(p), (SQUARE_SIZE - 10, SQUARE_SIZE - 10))
-                rect.move_ip(5, 5)
-                pygame.draw.rect(self.screen, GREEN_PATH, rect, 3)
+        for p1, p2 in self.edge_lines:
+            pygame.draw.line(self.screen, EDGE_COLOR, p1, p2, 2)
+
+        # 3. Draw Path Overlay (one batched green polyline)
+        if self.path_found and not self.animating_path and len(self.path_points) > 1:
+            pygame.draw.lines(self.screen, GREEN_PATH, False, self.path_points, 4)
 
         # 4. Draw Current Node (Yellow)
-        if self.running_bfs and self.current_node:
+        if self.running_bfs and self.current_node is not None:
             rect = pygame.Rect(self.get_square_coords(self.current_node), (SQUARE_SIZE - 8, SQUARE_SIZE - 8))
             rect.move_ip(4, 4)
             pygame.draw.rect(self.screen, YELLOW_CURRENT, rect)
 
         # 5. Draw Start & Goal Markers
-        if self.start_pos:
-            x, y = self.get_square_coords(self.start_pos)
-            self.draw_piece_symbol(self.screen, self.current_piece, x, y)
-            
-        if self.goal_pos:
+        if self.start_pos is not None:
+            self.screen.blit(self.piece_surfaces[self.current_piece],
+                             self.get_square_coords(self.start_pos))
+
+        if self.goal_pos is not None:
             cx, cy = self.get_square_coords(self.goal_pos)
             pygame.draw.circle(self.screen, RED_GOAL, 
                                (cx + SQUARE_SIZE // 2, cy + SQUARE_SIZE // 2), 
                                SQUARE_SIZE // 3)
 
         # 6. Draw Moving Piece (Animation)
-        if self.start_pos:
-            rx, ry = self.render_pos
-            self.draw_piece_symbol(self.screen, self.current_piece, rx, ry)
+        if self.start_pos is not None:
+            self.screen.blit(self.piece_surfaces[self.current_piece], self.render_pos)
             
         pygame.display.flip()
 
@@ -383,35 +472,37 @@ class BFSVisualizer:
 
     def handle_mouse_click(self, pos):
         """Converts mouse click position to board coordinates and sets Start/Goal."""
+        self.dirty = True
         col = pos[0] // SQUARE_SIZE
         row = pos[1] // SQUARE_SIZE
-        p = Point(col, row)
-
-        if not is_on_board(p):
+        if not (0 <= col < BOARD_SIZE and 0 <= row < BOARD_SIZE):
             return
+        sq = row * BOARD_SIZE + col
 
         if self.path_found or self.animating_path:
             self.reset_state()
         elif self.start_pos is None:
-            self.start_pos = p
-            self.render_pos = self.get_square_coords(p)
-        elif self.goal_pos is None and p != self.start_pos:
-            self.goal_pos = p
+            self.start_pos = sq
+            self.render_pos = self.get_square_coords(sq)
+        elif self.goal_pos is None and sq != self.start_pos:
+            self.goal_pos = sq
         elif not self.running_bfs:
             # Click again on the board to reset if not running
             self.reset_state()
 
     def handle_key_press(self, key):
         """Handles keyboard shortcuts for starting BFS and switching pieces."""
+        self.dirty = True
         if key == pygame.K_SPACE:
-            if self.start_pos and self.goal_pos and not self.running_bfs and not self.path_found:
+            if self.start_pos is not None and self.goal_pos is not None \
+                    and not self.running_bfs and not self.path_found:
                 self.start_bfs()
         elif key == pygame.K_r:
             self.reset_state()
         elif pygame.K_1 <= key <= pygame.K_5:
             self.current_piece = key - pygame.K_1
             # Reset state but keep start/goal if possible
-            if self.start_pos and self.goal_pos:
+            if self.start_pos is not None and self.goal_pos is not None:
                 s, g = self.start_pos, self.goal_pos
                 self.reset_state()
                 self.start_pos, self.goal_pos = s, g
@@ -423,8 +514,6 @@ class BFSVisualizer:
         """The main game loop."""
         running = True
         while running:
-            current_time = time.time() * 1000 # Convert to milliseconds
-
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -436,16 +525,21 @@ class BFSVisualizer:
 
             # Logic Update
             if self.running_bfs:
-                # Controlled stepping of BFS based on delay
+                # Controlled stepping of BFS based on delay; get_ticks is
+                # SDL's cached integer millisecond counter
+                current_time = pygame.time.get_ticks()
                 if current_time - self.last_bfs_step_time > BFS_DELAY_MS:
                     self.step_bfs()
                     self.last_bfs_step_time = current_time
             elif self.animating_path:
                 self.update_animation()
 
-            # Drawing
-            self.screen.fill(BLACK) # Clear screen
-            self.draw_scene()
+            # Drawing: skip the flip entirely while the scene is idle (the
+            # board surface covers the whole screen, so no separate clear
+            # is needed)
+            if self.dirty or self.running_bfs or self.animating_path:
+                self.draw_scene()
+                self.dirty = False
             
             self.clock.tick(FPS)
 
@@ -453,5 +547,6 @@ class BFSVisualizer:
         sys.exit()
 
 if __name__ == '__main__':
+    _precompute_all()
     visualizer = BFSVisualizer()
     visualizer.run()
\ No newline at end of file
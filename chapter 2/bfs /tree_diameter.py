@@ -1,14 +1,20 @@
-from time import sleep
 import pygame
-from math import hypot
-from collections import deque
-from typing import List, Tuple ,Callable
+import numpy as np
+from array import array
+from typing import List, Tuple
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the kernel just runs interpreted
+    def njit(func):
+        return func
 pygame.init()
 white = (255, 255, 255)
 green = (0, 255, 0)
 blue = (0, 0, 128)
 red = (255, 0, 0)
 WIDTH, HEIGHT = 800, 600
+ANIM_DELAY_MS = 200  # delay between replayed BFS steps
 WIN = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("tree_diameter")
 
@@ -18,150 +24,243 @@ long_end=None
 diameter=None
 long_start=None
 NODE_RADIUS = 15
-nodes = []
-nodes_dic={}
-edges = []
+NODE_RADIUS_SQ = NODE_RADIUS * NODE_RADIUS
 
-selected_node = None
-
-font = pygame.font.SysFont(None, 24)
-
-class Node:
-    def __init__(self,pos):
-        self.pos=pos
-        self.Visited=False
-        self.Neighbours=[]
-        self.Distance=0
+# Structure-of-Arrays node storage: nodes are ids (0..n-1) and every
+# per-node field lives in its own flat array, so BFS walks contiguous
+# memory instead of chasing object attributes. Deleted nodes are
+# tombstoned (positions[i] = None) so ids stay stable, and edges are
+# implied by the adjacency lists instead of kept in a separate list
+positions: List[Tuple[int,int]|None] = []  # positions[i] -> (x, y), None if deleted
+neighbours: List[List[int]] = []           # neighbours[i] -> adjacent node ids
+distance = array('i')                      # distance[i] -> BFS distance, for the labels
 
-    
-class Edge():
-    def __init__(self,start,end):
-        self.start=start
-        self.end=end
-
-    def other_end(self,node): 
-        if node == self.end : return self.start
-        if node == self.start : return self.end
+selected_node = None
 
-    def include_node(self,node):
-        if node == self.end or node == self.start : return True
-        return False
+# Cached edge layer: rebuilt only when the graph changes, then blitted
+# in one call per frame instead of one draw.line per edge
+edges_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+edges_dirty = True
 
+font = pygame.font.SysFont(None, 24)
 
-def reset_nodes(nodes:List[Node])->None:
-    for node in nodes:
-        node.Visited=False
-        node.Distance=0
 
-def bfs(draw:Callable, start:Node)-> Node :
-    global selected_node
-    qeue=deque([start])
+def add_node(pos:Tuple[int,int])-> int:
+    positions.append(pos)
+    neighbours.append([])
+    distance.append(0)
+    return len(positions)-1
+
+def remove_node(sel:int)->None:
+    global edges_dirty
+    # unlink sel from each neighbour's list, then tombstone its slot;
+    # touches only deg(sel) lists instead of scanning every edge
+    for nb in neighbours[sel]:
+        neighbours[nb].remove(sel)
+    neighbours[sel]=[]
+    positions[sel]=None
+    edges_dirty=True
+
+def reset_nodes()->None:
+    for i in range(len(distance)):
+        distance[i]=0
+
+def build_csr()-> Tuple[np.ndarray, np.ndarray]:
+    """Packs the adjacency lists into CSR (offsets, adj) int32 arrays."""
+    n=len(neighbours)
+    offsets=np.zeros(n+1, np.int32)
+    for i in range(n):
+        offsets[i+1]=offsets[i]+len(neighbours[i])
+    adj=np.empty(int(offsets[n]), np.int32)
+    k=0
+    for lst in neighbours:
+        for nb in lst:
+            adj[k]=nb
+            k+=1
+    return offsets, adj
+
+@njit
+def bfs_kernel(offsets, adj, start, visited_arr, distance_arr, order):
+    # flat ring-buffer queue; mark on enqueue so every node enters once.
+    # Records the pop order into `order` and returns (far_node, count)
+    n=offsets.shape[0]-1
+    queue=np.empty(n, np.int32)
+    head=0
+    tail=0
+    queue[tail]=start
+    tail+=1
+    visited_arr[start]=1
     far_node=start
-    while(qeue):
-        corrent_node=qeue[0]
-        if corrent_node.Visited:
-            qeue.popleft()
-        else:
-            for node in corrent_node.Neighbours:
-                qeue.append(node)
-                if node.Distance==0 and node != start:
-                    node.Distance=corrent_node.Distance+1
-                    if node.Distance>far_node.Distance:
-                        far_node=node
-                    
-            corrent_node.Visited=True
-            selected_node=corrent_node
-            draw()
-            sleep(0.2)
-            qeue.popleft()
-
-    return far_node
-
-
-def find_diameter(draw:Callable,selected_node:Node)->Tuple[Node, Node]:
-    reset_nodes(nodes)
-    start=bfs(draw,selected_node)
-    sleep(0.5)
-    reset_nodes(nodes)
-    end=bfs(draw,start)
-    return (start,end)
-    
-
-
+    while head<tail:
+        current=queue[head]
+        order[head]=current
+        head+=1
+        for i in range(offsets[current], offsets[current+1]):
+            nb=adj[i]
+            if visited_arr[nb]:
+                continue
+            visited_arr[nb]=1
+            distance_arr[nb]=distance_arr[current]+1
+            if distance_arr[nb]>distance_arr[far_node]:
+                far_node=nb
+            queue[tail]=nb
+            tail+=1
+    return far_node, tail
+
+def bfs(start:int)-> Tuple[int, List[int], np.ndarray]:
+    """Runs the whole search instantly in the compiled kernel.
+
+    Returns (far node, visitation order, distances); the main loop
+    replays the order for the animation instead of blocking in here.
+    """
+    n=len(positions)
+    offsets, adj=build_csr()
+    visited_arr=np.zeros(n, np.uint8)
+    distance_arr=np.zeros(n, np.int32)
+    order=np.empty(n, np.int32)
+    far_node, count=bfs_kernel(offsets, adj, start, visited_arr, distance_arr, order)
+    return int(far_node), [int(order[i]) for i in range(count)], distance_arr
+
+
+def find_diameter(selected_node:int)->Tuple[int, int, List]:
+    """Runs both BFSes back-to-back and returns (start, end, replay steps).
+
+    A step is (node, distance) to reveal, or None for the reset pause
+    between the two searches.
+    """
+    start, order1, dist1=bfs(selected_node)
+    end, order2, dist2=bfs(start)
+    steps=[(nd,int(dist1[nd])) for nd in order1]
+    steps.append(None)
+    steps+=[(nd,int(dist2[nd])) for nd in order2]
+    return (start,end,steps)
+
+
+
+
+def rebuild_edges_surface()->None:
+    # each undirected edge drawn once, from the adjacency lists
+    edges_surface.fill((0, 0, 0, 0))
+    for u in range(len(positions)):
+        for v in neighbours[u]:
+            if v > u:
+                pygame.draw.line(edges_surface, white, positions[u], positions[v], 3)
 
 def draw():
+    global edges_dirty
     WIN.fill((25, 25, 25))
-    text = font.render(f'diameter of this tree is : {long_end.Distance if long_end else "?" }', True, green)
+    text = font.render(f'diameter of this tree is : {distance[long_end] if long_end is not None else "?" }', True, green)
     textRect = text.get_rect()
     textRect.center = (WIDTH-120,HEIGHT-20)
     WIN.blit(text, textRect)
-    # Draw edges
-    for edge in edges:
-        pygame.draw.line(WIN, white, edge.start.pos,edge.end.pos, 3)
+    # Draw edges from the cached layer
+    if edges_dirty:
+        rebuild_edges_surface()
+        edges_dirty=False
+    WIN.blit(edges_surface, (0, 0))
 
     # Draw nodes
-    for node in nodes:
-        pygame.draw.circle(WIN, (100, 180, 255), (node.pos), NODE_RADIUS)
-        pygame.draw.circle(WIN, white, (node.pos), NODE_RADIUS, 2)
-        text = font.render(f'{node.Distance}', True, green)
+    for i in range(len(positions)):
+        if positions[i] is None:
+            continue
+        pygame.draw.circle(WIN, (100, 180, 255), positions[i], NODE_RADIUS)
+        pygame.draw.circle(WIN, white, positions[i], NODE_RADIUS, 2)
+        text = font.render(f'{distance[i]}', True, green)
         textRect = text.get_rect()
-        textRect.center = (node.pos[0],node.pos[1])
+        textRect.center = (positions[i][0],positions[i][1])
         WIN.blit(text, textRect)
     # Highlight selected node
-    if selected_node:
+    if selected_node is not None:
 
-        pygame.draw.circle(WIN, green, selected_node.pos, NODE_RADIUS + 4, 2)
-    if long_start and long_end:
+        pygame.draw.circle(WIN, green, positions[selected_node], NODE_RADIUS + 4, 2)
+    if long_start is not None and long_end is not None:
 
-        pygame.draw.circle(WIN, red, long_start.pos, NODE_RADIUS + 4, 2)
-        pygame.draw.circle(WIN, red, long_end.pos, NODE_RADIUS + 4, 2)
+        pygame.draw.circle(WIN, red, positions[long_start], NODE_RADIUS + 4, 2)
+        pygame.draw.circle(WIN, red, positions[long_end], NODE_RADIUS + 4, 2)
 
 
 
     pygame.display.update()
 
-def get_node_at_pos(pos:Tuple[int,int])-> None|Node:
+def get_node_at_pos(pos:Tuple[int,int])-> None|int:
     x, y = pos
-    for node in nodes:
-        nx,ny=node.pos
-        if hypot(nx - x, ny - y) <= NODE_RADIUS:
-            return node
+    for i in range(len(positions)):
+        if positions[i] is None:
+            continue
+        nx,ny=positions[i]
+        dx=nx - x
+        dy=ny - y
+        # compare squared distances, no sqrt needed
+        if dx*dx + dy*dy <= NODE_RADIUS_SQ:
+            return i
     return None
 
 def main():
-    global selected_node,long_end,long_start
+    global selected_node,long_end,long_start,edges_dirty
     run = True
+    # replay state: pending (node, distance) steps and the final result
+    anim_steps=[]
+    anim_index=0
+    last_step_time=0
+    result=None
+    dirty=True  # only redraw when input or the replay changed something
     while run:
 
-        draw()
+        # advance the replay without blocking the event loop
+        if anim_steps:
+            now=pygame.time.get_ticks()
+            if now-last_step_time>=ANIM_DELAY_MS:
+                last_step_time=now
+                dirty=True
+                step=anim_steps[anim_index]
+                if step is None:
+                    # pause + reset between the two searches
+                    reset_nodes()
+                    selected_node=None
+                else:
+                    nd,d=step
+                    distance[nd]=d
+                    selected_node=nd
+                anim_index+=1
+                if anim_index>=len(anim_steps):
+                    anim_steps=[]
+                    long_start,long_end=result
+                    selected_node=None
+
+        if dirty:
+            draw()
+            dirty=False
         for event in pygame.event.get():
 
             if event.type == pygame.QUIT:
                 run = False
 
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+                dirty=True
+
             # LEFT CLICK → Add node
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not anim_steps:
                 pos = event.pos
                 if get_node_at_pos(pos) is None:  # Avoid overlapping nodes
-                    nodes.append(Node(pos))
+                    add_node(pos)
 
 
 
             # RIGHT CLICK → Connect nodes
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3 and not anim_steps:
                 pos = event.pos
                 clicked = get_node_at_pos(pos)
                 # print(edges)
-                if clicked:
+                if clicked is not None:
                     if selected_node is None:
                         selected_node = clicked
                     else:
                         # Create edge if not duplicate
-                        if clicked not in selected_node.Neighbours :
+                        if clicked not in neighbours[selected_node] :
                             if selected_node != clicked:
-                                selected_node.Neighbours.append(clicked)
-                                clicked.Neighbours.append(selected_node)
-                                edges.append(Edge(selected_node,clicked))
+                                neighbours[selected_node].append(clicked)
+                                neighbours[clicked].append(selected_node)
+                                edges_dirty = True
                         selected_node = None
 
 
@@ -169,38 +268,37 @@ def main():
             # removing selected node and all of it's edges by pressing DELETE
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_BACKSPACE, pygame.K_DELETE):
                 print("DELETE")
-                if selected_node:
-                    for edge in edges.copy():
-                        if edge.include_node(selected_node):
-                            edges.remove(edge)
-                            del edge
-                    nodes.remove(selected_node)
-                    del selected_node
+                if selected_node is not None and not anim_steps:
+                    # ids stay stable, only drop highlights on the deleted node
+                    if selected_node in (long_start,long_end):
+                        long_end=None
+                        long_start=None
+                    remove_node(selected_node)
                     selected_node=None
 
-            
+
             if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                long_end=None
-                long_start=None
-                reset_nodes(nodes)
+                if not anim_steps:
+                    long_end=None
+                    long_start=None
+                    reset_nodes()
 
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
 
-                if selected_node:
-                    long_start,long_end=find_diameter(draw,selected_node)
+                if selected_node is not None and not anim_steps:
+                    long_end=None
+                    long_start=None
+                    reset_nodes()
+                    s,e,anim_steps=find_diameter(selected_node)
+                    result=(s,e)
+                    anim_index=0
+                    last_step_time=pygame.time.get_ticks()
                     selected_node=None
 
 
 
 
 
-
-                
-
-
-
-
-
     pygame.quit()
 
 main()